@@ -1,55 +1,153 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
 from dataclasses import dataclass, field
-from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Callable, Dict, List, Optional, Tuple
+from array import array
 import json
+import math
+import mmap
 import os
+import pickle
+import sys
+import time
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib encoder
+    orjson = None
 
 # -----------------------------
 # Domain model
 # -----------------------------
 
-@dataclass
+_TYPE_DEPOSIT = sys.intern("DEPOSIT")
+_TYPE_WITHDRAW = sys.intern("WITHDRAW")
+_TYPE_TRANSFER_IN = sys.intern("TRANSFER_IN")
+_TYPE_TRANSFER_OUT = sys.intern("TRANSFER_OUT")
+_TYPES = {t: t for t in (_TYPE_DEPOSIT, _TYPE_WITHDRAW, _TYPE_TRANSFER_IN, _TYPE_TRANSFER_OUT)}
+
+# Set HISTORY_LIMIT to keep only the most recent transactions per account.
+# This permanently discards older entries, so it is off by default. New
+# transactions trim in chunks of HISTORY_TRIM so trimming stays amortised
+# O(1); loading a file never trims.
+HISTORY_LIMIT: Optional[int] = None
+HISTORY_TRIM = 1_000
+
+# Amounts are stored as cents in a signed 64-bit array
+_MAX_CENTS = 2 ** 63 - 1
+
+# Saved file format: version 1 (no "version" key) stored currency units,
+# version 2 stores integer cents
+_FORMAT_VERSION = 2
+
+# dataclass(slots=True) needs Python 3.10+; older versions keep a __dict__
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+@dataclass(**_SLOTS)
 class Transaction:
     timestamp: str
     type: str
-    amount: float
+    amount: int  # cents
     note: str = ""
 
-@dataclass
+@dataclass(**_SLOTS)
 class Account:
     account_id: str
     holder_name: str
-    balance: float = 0.0
-    history: List[Transaction] = field(default_factory=list)
-
-    def deposit(self, amount: float, note: str = ""):
-        if amount <= 0:
+    balance: int = 0  # cents
+    # History is stored column-wise: one entry per transaction in each list.
+    hist_ts: List[str] = field(default_factory=list)
+    hist_type: List[str] = field(default_factory=list)
+    hist_amount: array = field(default_factory=lambda: array("q"))
+    hist_note: List[str] = field(default_factory=list)
+
+    @property
+    def history(self) -> Tuple[Transaction, ...]:
+        # Read-only snapshot; add entries with record_transaction()
+        return tuple(Transaction(*row) for row in
+                     zip(self.hist_ts, self.hist_type, self.hist_amount, self.hist_note))
+
+    def record_transaction(self, timestamp: str, type: str, amount: int, note: str = "",
+                           trim: bool = False):
+        # The only supported way to add history. The typed amount column is
+        # appended first so a rejected amount leaves all columns untouched.
+        self.hist_amount.append(amount)
+        self.hist_ts.append(timestamp)
+        self.hist_type.append(type)
+        self.hist_note.append(note)
+        if not trim or HISTORY_LIMIT is None:
+            return
+        excess = len(self.hist_ts) - HISTORY_LIMIT
+        if excess >= HISTORY_TRIM:
+            del self.hist_ts[:excess]
+            del self.hist_type[:excess]
+            del self.hist_amount[:excess]
+            del self.hist_note[:excess]
+
+    def deposit(self, amount: float, note: str = "") -> int:
+        # Returns the amount actually booked, in cents
+        cents = _to_cents(amount)
+        if cents <= 0:
             raise ValueError("Deposit amount must be positive.")
-        self.balance += amount
-        self.history.append(Transaction(
-            timestamp=_now(),
-            type="DEPOSIT",
-            amount=amount,
-            note=note
-        ))
-
-    def withdraw(self, amount: float, note: str = ""):
-        if amount <= 0:
+        if self.balance + cents > _MAX_CENTS:
+            raise ValueError("Balance limit exceeded.")
+        self.balance += cents
+        self.record_transaction(_now(), _TYPE_DEPOSIT, cents, note, trim=True)
+        return cents
+
+    def withdraw(self, amount: float, note: str = "") -> int:
+        # Returns the amount actually booked, in cents
+        cents = _to_cents(amount)
+        if cents <= 0:
             raise ValueError("Withdrawal amount must be positive.")
-        if amount > self.balance:
+        if cents > self.balance:
             raise ValueError("Insufficient funds.")
-        self.balance -= amount
-        self.history.append(Transaction(
-            timestamp=_now(),
-            type="WITHDRAW",
-            amount=amount,
-            note=note
-        ))
+        self.balance -= cents
+        self.record_transaction(_now(), _TYPE_WITHDRAW, cents, note, trim=True)
+        return cents
+
+def _to_cents(x: float) -> int:
+    if not math.isfinite(x):
+        raise ValueError("Amount must be a finite number.")
+    cents = round(x * 100)
+    if abs(cents) > _MAX_CENTS:
+        raise ValueError("Amount is too large.")
+    return cents
+
+def _fmt_cents(cents: int) -> str:
+    sign = "-" if cents < 0 else ""
+    units, rem = divmod(abs(cents), 100)
+    return f"{sign}{units}.{rem:02d}"
+
+def _cents_from_json(value, version: int) -> int:
+    # Version 1 files store amounts in currency units
+    if version < 2:
+        return _to_cents(float(value))
+    return int(value)
+
+def _dumps(obj) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+class _PlainUnpickler(pickle.Unpickler):
+    # The data file only holds dicts, lists, strings and numbers, so refuse
+    # anything that would import a class or call a function
+    def find_class(self, module, name):
+        raise pickle.UnpicklingError(f"Unexpected object {module}.{name} in data file.")
+
+_last_ts_int = 0
+_last_ts_str = ""
 
 def _now() -> str:
-    return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    # Timestamps have one-second resolution, so reuse the formatted string
+    # for every transaction recorded within the same second.
+    global _last_ts_int, _last_ts_str
+    t = int(time.time())
+    if t != _last_ts_int:
+        _last_ts_str = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(t))
+        _last_ts_int = t
+    return _last_ts_str
 
 class Bank:
     def __init__(self):
@@ -60,88 +158,181 @@ class Bank:
             raise ValueError("Account ID cannot be empty.")
         if not holder_name.strip():
             raise ValueError("Holder name cannot be empty.")
-        if account_id in self.accounts:
-            raise ValueError("Account ID already exists.")
         if initial_deposit < 0:
             raise ValueError("Initial deposit cannot be negative.")
         acc = Account(account_id=account_id.strip(), holder_name=holder_name.strip())
-        if initial_deposit > 0:
+        if _to_cents(initial_deposit) > 0:
             acc.deposit(initial_deposit, note="Initial deposit")
-        self.accounts[acc.account_id] = acc
+        if self.accounts.setdefault(acc.account_id, acc) is not acc:
+            raise ValueError("Account ID already exists.")
         return acc
 
     def get_account(self, account_id: str) -> Account:
-        if account_id not in self.accounts:
+        acc = self.accounts.get(account_id)
+        if acc is None:
             raise ValueError("Account not found.")
-        return self.accounts[account_id]
+        return acc
 
-    def transfer(self, from_id: str, to_id: str, amount: float, note: str = ""):
+    def transfer(self, from_id: str, to_id: str, amount: float, note: str = "") -> int:
+        # Returns the amount actually moved, in cents
         if from_id == to_id:
             raise ValueError("Source and destination accounts must differ.")
-        if amount <= 0:
+        cents = _to_cents(amount)
+        if cents <= 0:
             raise ValueError("Transfer amount must be positive.")
         src = self.get_account(from_id)
         dst = self.get_account(to_id)
-        if amount > src.balance:
+        if cents > src.balance:
             raise ValueError("Insufficient funds in source account.")
+        if dst.balance + cents > _MAX_CENTS:
+            raise ValueError("Balance limit exceeded in destination account.")
         # Perform transfer
-        src.balance -= amount
-        src.history.append(Transaction(
-            timestamp=_now(),
-            type="TRANSFER_OUT",
-            amount=amount,
-            note=f"To {to_id}. {note}".strip()
-        ))
-        dst.balance += amount
-        dst.history.append(Transaction(
-            timestamp=_now(),
-            type="TRANSFER_IN",
-            amount=amount,
-            note=f"From {from_id}. {note}".strip()
-        ))
+        ts = _now()
+        src.balance -= cents
+        src.record_transaction(ts, _TYPE_TRANSFER_OUT, cents, f"To {to_id}. {note}".strip(), trim=True)
+        dst.balance += cents
+        dst.record_transaction(ts, _TYPE_TRANSFER_IN, cents, f"From {from_id}. {note}".strip(), trim=True)
+        return cents
 
     # Optional simple persistence
     def save_to_file(self, path: str):
-        data = {
-            "accounts": [
-                {
+        # Stream each account and transaction straight to the file instead of
+        # building one big nested dict first.
+        with open(path, "wb", buffering=1 << 20) as f:
+            f.write(b'{"version":%d,"accounts":[' % _FORMAT_VERSION)
+            for i, acc in enumerate(self.accounts.values()):
+                if i:
+                    f.write(b",")
+                header = _dumps({
                     "account_id": acc.account_id,
                     "holder_name": acc.holder_name,
-                    "balance": acc.balance,
-                    "history": [
-                        {
-                            "timestamp": t.timestamp,
-                            "type": t.type,
-                            "amount": t.amount,
-                            "note": t.note
-                        } for t in acc.history
-                    ]
-                } for acc in self.accounts.values()
-            ]
-        }
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2)
-
-    def load_from_file(self, path: str):
-        if not os.path.exists(path):
-            return
-        with open(path, "r", encoding="utf-8") as f:
-            data = json.load(f)
-        self.accounts.clear()
+                    "balance": acc.balance
+                })
+                f.write(header[:-1])
+                f.write(b',"history":[')
+                rows = zip(acc.hist_ts, acc.hist_type, acc.hist_amount, acc.hist_note)
+                for j, (ts, type_, amount, note) in enumerate(rows):
+                    if j:
+                        f.write(b",")
+                    f.write(_dumps({
+                        "timestamp": ts,
+                        "type": type_,
+                        "amount": amount,
+                        "note": note
+                    }))
+                f.write(b"]}")
+            f.write(b"]}")
+
+    def _to_payload(self, columns: bool = False) -> dict:
+        # Plain dicts/lists in the saved file schema. With columns=True each
+        # account's history is kept as parallel lists instead of row dicts,
+        # which is what the pickle format stores.
+        accounts = []
+        for acc in self.accounts.values():
+            entry = {
+                "account_id": acc.account_id,
+                "holder_name": acc.holder_name,
+                "balance": acc.balance
+            }
+            if columns:
+                entry["columns"] = {
+                    "timestamp": list(acc.hist_ts),
+                    "type": list(acc.hist_type),
+                    "amount": acc.hist_amount.tolist(),
+                    "note": list(acc.hist_note)
+                }
+            else:
+                entry["history"] = [
+                    {
+                        "timestamp": ts,
+                        "type": type_,
+                        "amount": amount,
+                        "note": note
+                    } for ts, type_, amount, note in
+                    zip(acc.hist_ts, acc.hist_type, acc.hist_amount, acc.hist_note)
+                ]
+            accounts.append(entry)
+        return {"version": _FORMAT_VERSION, "accounts": accounts}
+
+    def _from_payload(self, data: dict):
+        version = data.get("version", 1)
+        # Build into a fresh dict so a bad entry leaves the current accounts intact
+        accounts: Dict[str, Account] = {}
         for acc in data.get("accounts", []):
             a = Account(
                 account_id=acc["account_id"],
                 holder_name=acc["holder_name"],
-                balance=float(acc.get("balance", 0.0))
+                balance=_cents_from_json(acc.get("balance", 0), version)
             )
+            cols = acc.get("columns")
+            if cols is not None:
+                amounts = cols["amount"]
+                if version < 2:
+                    amounts = [_cents_from_json(x, version) for x in amounts]
+                a.hist_amount = array("q", amounts)
+                a.hist_ts = list(cols["timestamp"])
+                a.hist_type = [_TYPES.get(t, t) for t in cols["type"]]
+                a.hist_note = list(cols["note"])
+                if not len(a.hist_amount) == len(a.hist_ts) == len(a.hist_type) == len(a.hist_note):
+                    raise ValueError(f"History columns of account {a.account_id} differ in length.")
             for t in acc.get("history", []):
-                a.history.append(Transaction(
-                    timestamp=t["timestamp"],
-                    type=t["type"],
-                    amount=float(t["amount"]),
-                    note=t.get("note", "")
-                ))
-            self.accounts[a.account_id] = a
+                a.record_transaction(
+                    t["timestamp"],
+                    _TYPES.get(t["type"], t["type"]),
+                    _cents_from_json(t["amount"], version),
+                    t.get("note", "")
+                )
+            accounts[a.account_id] = a
+        self.accounts.clear()
+        self.accounts.update(accounts)
+
+    def export_pretty(self, path: str):
+        # Indented, human-readable copy of the data; save_to_file stays compact
+        data = self._to_payload()
+        if orjson is not None:
+            with open(path, "wb") as f:
+                f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        else:
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(data, f, indent=2)
+
+    def load_from_file(self, path: str):
+        try:
+            fd = os.open(path, os.O_RDONLY)
+        except FileNotFoundError:
+            return
+        try:
+            mm = mmap.mmap(fd, 0, access=mmap.ACCESS_READ)
+        finally:
+            os.close(fd)
+        try:
+            if orjson is not None:
+                # Parse straight from the mapped pages without copying the file
+                with memoryview(mm) as view:
+                    data = orjson.loads(view)
+            else:
+                data = json.loads(mm[:])
+        finally:
+            mm.close()
+        self._from_payload(data)
+
+    # Binary persistence for the app's own data file; JSON stays for export.
+    # Only the plain payload is pickled, never the Account objects themselves,
+    # with history as column lists so no per-transaction objects are built.
+    def save_to_file_fast(self, path: str):
+        with open(path, "wb") as f:
+            pickle.dump(self._to_payload(columns=True), f, protocol=pickle.HIGHEST_PROTOCOL)
+
+    def load_from_file_fast(self, path: str) -> bool:
+        # Returns False if the file does not exist
+        try:
+            f = open(path, "rb")
+        except FileNotFoundError:
+            return False
+        with f:
+            data = _PlainUnpickler(f).load()
+        self._from_payload(data)
+        return True
 
 # -----------------------------
 # Tkinter GUI
@@ -154,6 +345,8 @@ class BankingApp(tk.Tk):
         self.geometry("900x600")
         self.bank = bank
         self.data_file = data_file
+        self._refresh_pending = False
+        self._tree_item_by_acc: Dict[str, str] = {}
 
         self.columnconfigure(0, weight=1)
         self.rowconfigure(0, weight=1)
@@ -164,7 +357,7 @@ class BankingApp(tk.Tk):
         # Load persisted data if available
         if self.data_file:
             try:
-                self.bank.load_from_file(self.data_file)
+                self._load_data_file()
             except Exception as e:
                 messagebox.showwarning("Load failed", f"Could not load data: {e}")
         self._refresh_all_views()
@@ -184,6 +377,7 @@ class BankingApp(tk.Tk):
     def _build_notebook(self):
         nb = ttk.Notebook(self)
         nb.grid(row=0, column=0, sticky="nsew")
+        self.notebook = nb
 
         # Tabs
         self.tab_create = ttk.Frame(nb)
@@ -198,12 +392,27 @@ class BankingApp(tk.Tk):
         nb.add(self.tab_accounts, text="Accounts & balances")
         nb.add(self.tab_history, text="Transaction history")
 
-        # Build each tab
-        self._build_create_tab()
-        self._build_deposit_withdraw_tab()
-        self._build_transfer_tab()
-        self._build_accounts_tab()
-        self._build_history_tab()
+        # Build each tab the first time it is selected
+        self._tab_builders: Dict[ttk.Frame, Callable[[], None]] = {
+            self.tab_create: self._build_create_tab,
+            self.tab_deposit_withdraw: self._build_deposit_withdraw_tab,
+            self.tab_transfer: self._build_transfer_tab,
+            self.tab_accounts: self._build_accounts_tab,
+            self.tab_history: self._build_history_tab,
+        }
+        nb.bind("<<NotebookTabChanged>>", self._on_tab_changed)
+        self._on_tab_changed()
+
+    def _on_tab_changed(self, event=None):
+        frame = self.nametowidget(self.notebook.select())
+        builder = self._tab_builders.pop(frame, None)
+        if builder is not None:
+            builder()
+            # Fill the new widgets with the current accounts
+            self._refresh_all_views()
+
+    def _tab_built(self, frame: ttk.Frame) -> bool:
+        return frame not in self._tab_builders
 
     # ---- Create Account Tab ----
     def _build_create_tab(self):
@@ -236,7 +445,8 @@ class BankingApp(tk.Tk):
             self.entry_acc_id.delete(0, tk.END)
             self.entry_holder.delete(0, tk.END)
             self.entry_initial.delete(0, tk.END)
-            self._refresh_all_views()
+            self._show_account(acc)
+            self._refresh_account_ids()
         except Exception as e:
             messagebox.showerror("Error", str(e))
 
@@ -289,11 +499,11 @@ class BankingApp(tk.Tk):
         try:
             amt = float(amt_str)
             acc = self.bank.get_account(acc_id)
-            acc.deposit(amt, note)
-            messagebox.showinfo("Success", f"Deposited {amt:.2f} to {acc.account_id}.")
+            cents = acc.deposit(amt, note)
+            messagebox.showinfo("Success", f"Deposited {_fmt_cents(cents)} to {acc.account_id}.")
             self.entry_dep_amt.delete(0, tk.END)
             self.entry_dep_note.delete(0, tk.END)
-            self._refresh_all_views()
+            self._show_account(acc)
         except Exception as e:
             messagebox.showerror("Error", str(e))
 
@@ -304,11 +514,11 @@ class BankingApp(tk.Tk):
         try:
             amt = float(amt_str)
             acc = self.bank.get_account(acc_id)
-            acc.withdraw(amt, note)
-            messagebox.showinfo("Success", f"Withdrew {amt:.2f} from {acc.account_id}.")
+            cents = acc.withdraw(amt, note)
+            messagebox.showinfo("Success", f"Withdrew {_fmt_cents(cents)} from {acc.account_id}.")
             self.entry_wdr_amt.delete(0, tk.END)
             self.entry_wdr_note.delete(0, tk.END)
-            self._refresh_all_views()
+            self._show_account(acc)
         except Exception as e:
             messagebox.showerror("Error", str(e))
 
@@ -341,11 +551,12 @@ class BankingApp(tk.Tk):
         note = self.entry_tr_note.get().strip()
         try:
             amt = float(amt_str)
-            self.bank.transfer(from_id, to_id, amt, note)
-            messagebox.showinfo("Success", f"Transferred {amt:.2f} from {from_id} to {to_id}.")
+            cents = self.bank.transfer(from_id, to_id, amt, note)
+            messagebox.showinfo("Success", f"Transferred {_fmt_cents(cents)} from {from_id} to {to_id}.")
             self.entry_tr_amt.delete(0, tk.END)
             self.entry_tr_note.delete(0, tk.END)
-            self._refresh_all_views()
+            self._show_account(self.bank.get_account(from_id))
+            self._show_account(self.bank.get_account(to_id))
         except Exception as e:
             messagebox.showerror("Error", str(e))
 
@@ -380,7 +591,7 @@ class BankingApp(tk.Tk):
         acc_id = self.entry_lookup_id.get().strip()
         try:
             acc = self.bank.get_account(acc_id)
-            messagebox.showinfo("Balance", f"Account {acc.account_id} ({acc.holder_name}) balance: {acc.balance:.2f}")
+            messagebox.showinfo("Balance", f"Account {acc.account_id} ({acc.holder_name}) balance: {_fmt_cents(acc.balance)}")
         except Exception as e:
             messagebox.showerror("Error", str(e))
 
@@ -417,28 +628,70 @@ class BankingApp(tk.Tk):
             return
         try:
             acc = self.bank.get_account(acc_id)
-            for t in acc.history:
-                self.tree_history.insert("", "end", values=(t.timestamp, t.type, f"{t.amount:.2f}", t.note))
+            rows = [(ts, type_, _fmt_cents(amount), note) for ts, type_, amount, note in
+                    zip(acc.hist_ts, acc.hist_type, acc.hist_amount, acc.hist_note)]
+            insert = self.tree_history.insert
+            for row in rows:
+                insert("", "end", values=row)
         except Exception as e:
             messagebox.showerror("Error", str(e))
 
     # ---- Refresh / Save / Close ----
     def _refresh_all_views(self):
-        # Refresh accounts list
-        self.tree_accounts.delete(*self.tree_accounts.get_children())
+        # Coalesce refresh requests made within one event loop pass
+        if self._refresh_pending:
+            return
+        self._refresh_pending = True
+        self.after_idle(self._do_refresh_all_views)
+
+    def _do_refresh_all_views(self):
+        self._refresh_pending = False
+        # Drop rows for accounts that no longer exist, then add or update the rest
+        for acc_id in self._tree_item_by_acc.keys() - self.bank.accounts.keys():
+            self.tree_accounts.delete(self._tree_item_by_acc.pop(acc_id))
         for acc in self.bank.accounts.values():
-            self.tree_accounts.insert("", "end", values=(acc.account_id, acc.holder_name, f"{acc.balance:.2f}"))
+            self._show_account(acc)
+        self._refresh_account_ids()
 
+    def _show_account(self, acc: Account):
+        # Insert the account's row the first time, afterwards only touch its balance
+        if not self._tab_built(self.tab_accounts):
+            return
+        balance = _fmt_cents(acc.balance)
+        iid = self._tree_item_by_acc.get(acc.account_id)
+        if iid is None:
+            self._tree_item_by_acc[acc.account_id] = self.tree_accounts.insert(
+                "", "end", values=(acc.account_id, acc.holder_name, balance))
+        else:
+            self.tree_accounts.set(iid, "balance", balance)
+
+    def _refresh_account_ids(self):
         # Refresh combobox options
+        if not self._tab_built(self.tab_history):
+            return
         acc_ids = list(self.bank.accounts.keys())
         self.combo_hist_id["values"] = acc_ids
 
+    def _load_data_file(self):
+        if not self.data_file.endswith(".pkl"):
+            self.bank.load_from_file(self.data_file)
+            return
+        if not self.bank.load_from_file_fast(self.data_file):
+            # Pick up data saved by older versions that only wrote JSON
+            self.bank.load_from_file(os.path.splitext(self.data_file)[0] + ".json")
+
+    def _save_data_file(self):
+        if self.data_file.endswith(".pkl"):
+            self.bank.save_to_file_fast(self.data_file)
+        else:
+            self.bank.save_to_file(self.data_file)
+
     def _save(self):
         if not self.data_file:
             messagebox.showinfo("Info", "No data file configured. Launch with a path or modify the code to set one.")
             return
         try:
-            self.bank.save_to_file(self.data_file)
+            self._save_data_file()
             messagebox.showinfo("Saved", f"Data saved to {self.data_file}")
         except Exception as e:
             messagebox.showerror("Error", f"Save failed: {e}")
@@ -446,7 +699,7 @@ class BankingApp(tk.Tk):
     def _on_close(self):
         try:
             if self.data_file:
-                self.bank.save_to_file(self.data_file)
+                self._save_data_file()
         except Exception:
             pass
         self.destroy()
@@ -458,7 +711,7 @@ class BankingApp(tk.Tk):
 def main():
     bank = Bank()
     # Optional: set a data file for persistence in the current directory
-    data_file = "bank_data.json"
+    data_file = "bank_data.pkl"
     app = BankingApp(bank, data_file=data_file)
     app.mainloop()
 
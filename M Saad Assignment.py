@@ -1,13 +1,10 @@
+from collections import Counter
+
 s = input("Enter a string: ")
 
-letters = digits = special = 0
-for ch in s:
-    if ch.isalpha():
-        letters += 1
-    elif ch.isdigit():
-        digits += 1
-    else:
-        special += 1
+letters = sum(map(str.isalpha, s))
+digits = sum(map(str.isdigit, s))
+special = len(s) - letters - digits
 
 print("Letters:", letters)
 print("Digits:", digits)
@@ -18,20 +15,19 @@ print("Special characters:", special)
 start = int(input("Enter start: "))
 end = int(input("Enter end: "))
 
+matches = []
 for i in range(start, end + 1):
     if (i % 4 == 0 or i % 6 == 0) and not (i % 4 == 0 and i % 6 == 0):
-        print(i, end=" ")
+        matches.append(i)
+
+print(" ".join(map(str, matches)))
 
 #Count Uppercase and Lowercase Letters
 
 s = input("Enter a sentence: ")
 
-upper = lower = 0
-for ch in s:
-    if ch.isupper():
-        upper += 1
-    elif ch.islower():
-        lower += 1
+upper = sum(map(str.isupper, s))
+lower = sum(map(str.islower, s))
 
 print("Uppercase letters:", upper)
 print("Lowercase letters:", lower)
@@ -39,10 +35,7 @@ print("Lowercase letters:", lower)
 ###Replace Vowels with ‘*’
 
 word = input("Enter a word: ")
-vowels = "aeiouAEIOU"
-
-for v in vowels:
-    word = word.replace(v, '*')
+word = word.translate(str.maketrans("aeiouAEIOU", "*" * 10))
 
 print("After replacement:", word)
 
@@ -51,10 +44,7 @@ print("After replacement:", word)
 
 s = input("Enter a string: ")
 
-total = 0
-for ch in s:
-    if ch.isdigit():
-        total += int(ch)
+total = sum(map(int, filter(str.isdigit, s)))
 
 print("Sum of digits:", total)
 
@@ -74,44 +64,60 @@ print("Words starting with a vowel:", count)
 
 ##Display Numbers with Sum of Digits Even
 
+# Digit sums of 0-9999, so bigger numbers are summed four digits at a time
+DIGIT_SUM = [sum(map(int, str(i))) for i in range(10000)]
+
+def digit_sum(n):
+    n = abs(n)
+    total = 0
+    while n:
+        n, low = divmod(n, 10000)
+        total += DIGIT_SUM[low]
+    return total
 
 start = int(input("Enter start: "))
 end = int(input("Enter end: "))
 
+matches = []
 for i in range(start, end + 1):
-    digit_sum = sum(int(d) for d in str(i))
-    if digit_sum % 2 == 0:
-        print(i, end=" ")
+    if digit_sum(i) % 2 == 0:
+        matches.append(i)
+
+print(" ".join(map(str, matches)))
 
 #Character Frequency (Sorted)
 
 s = input("Enter a string: ")
 
-freq = {}
-for ch in s:
-    freq[ch] = freq.get(ch, 0) + 1
+freq = Counter(s)
 
-for ch in sorted(freq.keys()):
-    print(f"{ch}: {freq[ch]}")
+for ch, n in sorted(freq.items()):
+    print(f"{ch}: {n}")
 
 #Numbers Having 3 as a Digit
 
 start = int(input("Enter start: "))
 end = int(input("Enter end: "))
 
+matches = []
 for i in range(start, end + 1):
     if '3' in str(i):
-        print(i, end=" ")
+        matches.append(i)
+
+print(" ".join(map(str, matches)))
 
 ##Complex Divisibility with Digit Logic
 
 start = int(input("Enter start: "))
 end = int(input("Enter end: "))
 
+matches = []
 for i in range(start, end + 1):
-    sum_digits = sum(int(d) for d in str(i))
+    sum_digits = digit_sum(i)
     if ((i % 4 == 0 or i % 6 == 0) and not (i % 4 == 0 and i % 6 == 0)
         and sum_digits % 2 != 0 and i % 9 != 0):
-        print(i, end=" ")
+        matches.append(i)
+
+print(" ".join(map(str, matches)))
 
 